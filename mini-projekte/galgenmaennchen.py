@@ -16,15 +16,67 @@ bevor das Galgenmännchen vollständig gezeichnet ist.
 import random
 import sys
 import os
+import textwrap
 import time
-from typing import List, Tuple, Set, Optional
+from collections import namedtuple
+from typing import Tuple
+
+
+# Seltene Buchstaben zur Einstufung schwerer Wörter
+_SELTENE_BUCHSTABEN = frozenset("qxyvjpz")
+_SELTENE_BUCHSTABEN_EXPERTE = frozenset("qxyvjz")
+
+# Unveränderliche Einstellungen eines Schwierigkeitsgrades
+Schwierigkeit = namedtuple("Schwierigkeit", "versuche wortliste")
+
+# ANSI-Steuersequenz: Bildschirm leeren und Cursor nach oben links setzen
+_TERMINAL_LEEREN = "\x1b[2J\x1b[H"
+
+
+def _ansi_aktivieren() -> bool:
+    """
+    Prüft einmalig, ob das Terminal ANSI-Steuersequenzen verarbeiten kann.
+    
+    Unter Windows wird dafür die Verarbeitung virtueller Terminalsequenzen
+    der Konsole eingeschaltet.
+    
+    Returns:
+        True, wenn ANSI-Sequenzen verwendet werden können, sonst False
+    """
+    if os.name != 'nt':
+        return True
+        
+    try:
+        import ctypes
+        
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.GetStdHandle(-11)  # STD_OUTPUT_HANDLE
+        modus = ctypes.c_uint32()
+        if not kernel32.GetConsoleMode(handle, ctypes.byref(modus)):
+            return False
+            
+        # ENABLE_VIRTUAL_TERMINAL_PROCESSING
+        return bool(kernel32.SetConsoleMode(handle, modus.value | 0x0004))
+    except (AttributeError, OSError):
+        return False
+
+
+_ANSI_VERFUEGBAR = _ansi_aktivieren()
+
+
+def terminal_leeren() -> None:
+    """Leert das Terminal, ohne dafür einen eigenen Prozess zu starten."""
+    if _ANSI_VERFUEGBAR:
+        sys.stdout.write(_TERMINAL_LEEREN)
+    else:  # Ältere Windows-Konsolen ohne ANSI-Unterstützung
+        os.system('cls')
 
 
 class Hangman:
     """Klasse zur Verwaltung eines Hangman-Spiels."""
     
     # ASCII-Art für das Galgenmännchen (von 0 bis 6 Fehlversuchen)
-    HANGMAN_ASCII = [
+    HANGMAN_ASCII = tuple(textwrap.dedent(bild) for bild in (
         """
          -----
          |   |
@@ -88,10 +140,10 @@ class Hangman:
              |
         -----+-----
         """
-    ]
+    ))
     
     # Wortliste für das Spiel (kann erweitert werden)
-    WORTLISTE = [
+    WORTLISTE = (
         "apfel", "banane", "computer", "drucker", "elefant", "fenster", "garten",
         "haus", "insel", "jacke", "kalender", "lampe", "maus", "nacht", "orange",
         "pullover", "qualle", "regen", "sonne", "telefon", "uhr", "vogel", "wasser",
@@ -105,14 +157,22 @@ class Hangman:
         "ufer", "wind", "zaun", "adler", "birne", "dose", "eidechse", "frosch",
         "giraffe", "hai", "insekt", "kamel", "leopard", "muschel", "nilpferd",
         "pferd", "ratte", "schlange", "tiger", "wal", "ziege"
-    ]
+    )
     
-    # Schwierigkeitsgrade
+    # Schwierigkeitsgrade (Wortlisten werden einmalig beim Laden des Moduls gefiltert)
     SCHWIERIGKEITEN = {
-        "leicht": {"versuche": 8, "wortliste": None},  # Alle Wörter
-        "mittel": {"versuche": 6, "wortliste": None},  # Alle Wörter
-        "schwer": {"versuche": 6, "wortliste": None},  # Gefilterte Wörter (siehe __init__)
-        "experte": {"versuche": 5, "wortliste": None}  # Gefilterte Wörter (siehe __init__)
+        "leicht": Schwierigkeit(8, WORTLISTE),  # Alle Wörter
+        "mittel": Schwierigkeit(6, WORTLISTE),  # Alle Wörter
+        # Schwere Wörter: Länger oder mit seltenen Buchstaben
+        "schwer": Schwierigkeit(6, tuple(
+            wort for wort in WORTLISTE
+            if len(wort) >= 7 or not _SELTENE_BUCHSTABEN.isdisjoint(wort)
+        )),
+        # Experten-Wörter: Länger und mit seltenen Buchstaben
+        "experte": Schwierigkeit(5, tuple(
+            wort for wort in WORTLISTE
+            if len(wort) >= 8 and not _SELTENE_BUCHSTABEN_EXPERTE.isdisjoint(wort)
+        ))
     }
     
     def __init__(self, schwierigkeit: str = "mittel"):
@@ -127,24 +187,10 @@ class Hangman:
             schwierigkeit = "mittel"
             
         self.schwierigkeit = schwierigkeit
+        self._konfig = self.SCHWIERIGKEITEN[schwierigkeit]
         
-        # Wortlisten für Schwierigkeitsgrade vorbereiten (falls noch nicht geschehen)
-        if self.SCHWIERIGKEITEN["schwer"]["wortliste"] is None:
-            # Schwere Wörter: Länger oder mit seltenen Buchstaben
-            self.SCHWIERIGKEITEN["schwer"]["wortliste"] = [
-                wort for wort in self.WORTLISTE
-                if len(wort) >= 7 or any(c in wort for c in "qxyvjpz")
-            ]
-            
-        if self.SCHWIERIGKEITEN["experte"]["wortliste"] is None:
-            # Experten-Wörter: Länger und mit seltenen Buchstaben
-            self.SCHWIERIGKEITEN["experte"]["wortliste"] = [
-                wort for wort in self.WORTLISTE
-                if len(wort) >= 8 and any(c in wort for c in "qxyvjz")
-            ]
-            
         # Spielvariablen
-        self.max_versuche = self.SCHWIERIGKEITEN[schwierigkeit]["versuche"]
+        self.max_versuche = self._konfig.versuche
         self.fehlversuche = 0
         self.geratene_buchstaben = set()
         self.wort = ""
@@ -152,22 +198,20 @@ class Hangman:
         self.gewonnen = False
         self.hinweise_verwendet = 0
         
+        # Anzeigepuffer für das versteckte Wort (wird in neues_spiel aufgebaut)
+        self._positionen = {}
+        self._anzeige = []
+        self._verstecktes_wort = ""
+        self._verbleibende_buchstaben = 0
+        
         # Statistik
         self.spiele_gespielt = 0
         self.spiele_gewonnen = 0
         
     def neues_spiel(self) -> None:
         """Startet ein neues Hangman-Spiel."""
-        # Wortliste für den aktuellen Schwierigkeitsgrad auswählen
-        wortliste = self.SCHWIERIGKEITEN[self.schwierigkeit]["wortliste"]
-        
-        # Wenn keine spezifische Wortliste für den Schwierigkeitsgrad vorhanden ist,
-        # die allgemeine Wortliste verwenden
-        if wortliste is None:
-            wortliste = self.WORTLISTE
-            
-        # Zufälliges Wort auswählen
-        self.wort = random.choice(wortliste).lower()
+        # Zufälliges Wort aus der Wortliste des Schwierigkeitsgrades auswählen
+        self.wort = random.choice(self._konfig.wortliste).lower()
         
         # Spielvariablen zurücksetzen
         self.fehlversuche = 0
@@ -176,34 +220,47 @@ class Hangman:
         self.gewonnen = False
         self.hinweise_verwendet = 0
         
+        # Positionen jedes Buchstabens einmalig bestimmen, damit beim Raten
+        # nur die betroffenen Stellen aufgedeckt werden müssen
+        positionen = {}
+        for i, buchstabe in enumerate(self.wort):
+            positionen.setdefault(buchstabe, []).append(i)
+        self._positionen = positionen
+        self._anzeige = ["_"] * len(self.wort)
+        self._verstecktes_wort = " ".join(self._anzeige)
+        self._verbleibende_buchstaben = len(positionen)
+        
     def zeige_spielstand(self) -> None:
         """Zeigt den aktuellen Spielstand an."""
-        # Terminal leeren (plattformunabhängig)
-        if os.name == 'nt':  # Windows
-            os.system('cls')
-        else:  # Unix/Linux/MacOS
-            os.system('clear')
-            
-        print("\n=== HANGMAN ===")
+        # Terminal leeren (plattformunabhängig); mit ANSI-Unterstützung
+        # wird die Steuersequenz direkt mit dem Spielstand ausgegeben
+        if _ANSI_VERFUEGBAR:
+            zeilen = [_TERMINAL_LEEREN + "\n=== HANGMAN ==="]
+        else:
+            terminal_leeren()
+            zeilen = ["\n=== HANGMAN ==="]
         
         # Hangman-ASCII anzeigen
-        print(self.HANGMAN_ASCII[min(self.fehlversuche, len(self.HANGMAN_ASCII) - 1)])
+        zeilen.append(self.HANGMAN_ASCII[min(self.fehlversuche, len(self.HANGMAN_ASCII) - 1)])
         
         # Verstecktes Wort anzeigen
         verstecktes_wort = self._get_verstecktes_wort()
-        print(f"\nWort: {verstecktes_wort}")
+        zeilen.append(f"\nWort: {verstecktes_wort}")
         
         # Bereits geratene Buchstaben anzeigen
         if self.geratene_buchstaben:
             sortierte_buchstaben = sorted(self.geratene_buchstaben)
-            print(f"Geratene Buchstaben: {', '.join(sortierte_buchstaben)}")
+            zeilen.append(f"Geratene Buchstaben: {', '.join(sortierte_buchstaben)}")
             
         # Verbleibende Versuche anzeigen
         verbleibende_versuche = self.max_versuche - self.fehlversuche
-        print(f"Verbleibende Versuche: {verbleibende_versuche}")
+        zeilen.append(f"Verbleibende Versuche: {verbleibende_versuche}")
         
         # Schwierigkeitsgrad anzeigen
-        print(f"Schwierigkeitsgrad: {self.schwierigkeit}")
+        zeilen.append(f"Schwierigkeitsgrad: {self.schwierigkeit}")
+        
+        # Gesamten Spielstand mit einem einzigen Schreibaufruf ausgeben
+        sys.stdout.write("\n".join(zeilen) + "\n")
         
     def rate_buchstabe(self, buchstabe: str) -> Tuple[bool, str]:
         """
@@ -233,11 +290,12 @@ class Hangman:
         # Buchstabe zur Liste der geratenen Buchstaben hinzufügen
         self.geratene_buchstaben.add(buchstabe)
         
-        # Prüfen, ob der Buchstabe im Wort vorkommt
-        if buchstabe in self.wort:
+        # Prüfen, ob der Buchstabe im Wort vorkommt (Nachschlagen in der Positionstabelle)
+        if buchstabe in self._positionen:
+            self._decke_auf(buchstabe)
+            
             # Prüfen, ob das Wort vollständig geraten wurde
-            verstecktes_wort = self._get_verstecktes_wort()
-            if "_" not in verstecktes_wort:
+            if self._verbleibende_buchstaben == 0:
                 self.spielende = True
                 self.gewonnen = True
                 self.spiele_gespielt += 1
@@ -288,10 +346,10 @@ class Hangman:
         
         # Buchstabe zur Liste der geratenen Buchstaben hinzufügen
         self.geratene_buchstaben.add(hinweis_buchstabe)
+        self._decke_auf(hinweis_buchstabe)
         
         # Prüfen, ob das Wort vollständig geraten wurde
-        verstecktes_wort = self._get_verstecktes_wort()
-        if "_" not in verstecktes_wort:
+        if self._verbleibende_buchstaben == 0:
             self.spielende = True
             self.gewonnen = True
             self.spiele_gespielt += 1
@@ -300,6 +358,21 @@ class Hangman:
             
         return True, f"Hinweis: Der Buchstabe '{hinweis_buchstabe}' ist im Wort."
         
+    def _decke_auf(self, buchstabe: str) -> None:
+        """
+        Deckt alle Vorkommen eines richtig geratenen Buchstabens in der Anzeige auf.
+        
+        Args:
+            buchstabe: Der aufzudeckende Buchstabe
+        """
+        for i in self._positionen[buchstabe]:
+            self._anzeige[i] = buchstabe
+            
+        self._verbleibende_buchstaben -= 1
+        
+        # Mit Leerzeichen für bessere Lesbarkeit
+        self._verstecktes_wort = " ".join(self._anzeige)
+        
     def _get_verstecktes_wort(self) -> str:
         """
         Gibt das teilweise versteckte Wort basierend auf den bereits geratenen Buchstaben zurück.
@@ -307,15 +380,7 @@ class Hangman:
         Returns:
             Teilweise verstecktes Wort
         """
-        verstecktes_wort = ""
-        for buchstabe in self.wort:
-            if buchstabe in self.geratene_buchstaben:
-                verstecktes_wort += buchstabe
-            else:
-                verstecktes_wort += "_"
-                
-        # Mit Leerzeichen für bessere Lesbarkeit
-        return " ".join(verstecktes_wort)
+        return self._verstecktes_wort
         
     def get_statistik(self) -> dict:
         """
@@ -344,28 +409,44 @@ class Hangman:
             return False
             
         self.schwierigkeit = schwierigkeit
-        self.max_versuche = self.SCHWIERIGKEITEN[schwierigkeit]["versuche"]
+        self._konfig = self.SCHWIERIGKEITEN[schwierigkeit]
+        self.max_versuche = self._konfig.versuche
         return True
 
 
+# Hilfetext und Statistikvorlage werden nur einmal aufgebaut
+_HILFETEXT = """
+Hangman Hilfe
+=============
+Befehle:
+  <Buchstabe>      - Einen Buchstaben raten
+  neu              - Neues Spiel starten
+  schwierigkeit <niveau> - Schwierigkeitsgrad ändern
+                     (leicht, mittel, schwer, experte)
+  hinweis          - Einen Hinweis erhalten (kostet einen verbleibenden Versuch)
+  statistik        - Spielstatistik anzeigen
+  hilfe            - Diese Hilfeübersicht anzeigen
+  exit/quit        - Spiel beenden
+
+Spielregeln:
+  - Rate Buchstaben, um das versteckte Wort aufzudecken
+  - Jeder falsche Versuch ergänzt das Galgenmännchen
+  - Das Spiel ist verloren, wenn das Galgenmännchen vollständig ist
+  - Das Spiel ist gewonnen, wenn das Wort vollständig erraten wurde
+"""
+
+_STATISTIK_VORLAGE = """
+Spielstatistik
+==============
+Spiele gespielt: {spiele_gespielt}
+Spiele gewonnen: {spiele_gewonnen}
+Gewinnrate: {gewinnrate:.1f}%
+"""
+
+
 def print_help() -> None:
     """Zeigt die Hilfeübersicht für das Hangman-Spiel an."""
-    print("\nHangman Hilfe")
-    print("=============")
-    print("Befehle:")
-    print("  <Buchstabe>      - Einen Buchstaben raten")
-    print("  neu              - Neues Spiel starten")
-    print("  schwierigkeit <niveau> - Schwierigkeitsgrad ändern")
-    print("                     (leicht, mittel, schwer, experte)")
-    print("  hinweis          - Einen Hinweis erhalten (kostet einen verbleibenden Versuch)")
-    print("  statistik        - Spielstatistik anzeigen")
-    print("  hilfe            - Diese Hilfeübersicht anzeigen")
-    print("  exit/quit        - Spiel beenden")
-    print("\nSpielregeln:")
-    print("  - Rate Buchstaben, um das versteckte Wort aufzudecken")
-    print("  - Jeder falsche Versuch ergänzt das Galgenmännchen")
-    print("  - Das Spiel ist verloren, wenn das Galgenmännchen vollständig ist")
-    print("  - Das Spiel ist gewonnen, wenn das Wort vollständig erraten wurde")
+    sys.stdout.write(_HILFETEXT)
 
 
 def main() -> int:
@@ -448,12 +529,7 @@ def main() -> int:
                 
             elif user_input in ['statistik', 'stats', 'stat']:
                 statistik = spiel.get_statistik()
-                
-                print("\nSpielstatistik")
-                print("==============")
-                print(f"Spiele gespielt: {statistik['spiele_gespielt']}")
-                print(f"Spiele gewonnen: {statistik['spiele_gewonnen']}")
-                print(f"Gewinnrate: {statistik['gewinnrate']:.1f}%")
+                sys.stdout.write(_STATISTIK_VORLAGE.format(**statistik))
                 
                 input("\nDrücke ENTER, um fortzufahren...")
                 continue
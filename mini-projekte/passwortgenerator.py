@@ -13,13 +13,55 @@ Jede Gruppe besteht aus kleinen Buchstaben, mit beschränkter Anzahl
 von Großbuchstaben (max. 2) und Zahlen (max. 1) pro Gruppe.
 """
 
-import random
+import os
 import string
 import sys
-from typing import List, Tuple
+from typing import Iterator, Optional
 
 
-def generate_group(length: int = 6, max_uppercase: int = 2, max_digits: int = 1) -> str:
+def _random_bytes(block_size: int) -> Iterator[int]:
+    """
+    Liefert einen endlosen Strom kryptografisch sicherer Zufallsbytes.
+    
+    Die Bytes werden blockweise mit einem einzigen os.urandom-Aufruf
+    vom Betriebssystem geholt.
+    
+    Args:
+        block_size: Anzahl der Bytes, die pro Aufruf angefordert werden
+        
+    Returns:
+        Iterator über Zufallsbytes (Werte von 0 bis 255)
+    """
+    while True:
+        yield from os.urandom(block_size)
+
+
+def _random_index(random_bytes: Iterator[int], n: int) -> int:
+    """
+    Zieht einen gleichverteilten Index zwischen 0 und n - 1 (n <= 256).
+    
+    Bytes oberhalb des größten Vielfachen von n werden verworfen, damit
+    die Modulo-Abbildung keine Zeichen bevorzugt.
+    
+    Args:
+        random_bytes: Strom von Zufallsbytes
+        n: Anzahl der möglichen Werte
+        
+    Returns:
+        Zufälliger Index
+    """
+    limit = 256 - 256 % n
+    for byte in random_bytes:
+        if byte < limit:
+            return byte % n
+
+
+def generate_group(
+    length: int = 6,
+    max_uppercase: int = 2,
+    max_digits: int = 1,
+    random_bytes: Optional[Iterator[int]] = None
+) -> str:
     """
     Erzeugt eine Gruppe von Zeichen für das Passwort.
     
@@ -27,6 +69,7 @@ def generate_group(length: int = 6, max_uppercase: int = 2, max_digits: int = 1)
         length: Länge der zu erstellenden Gruppe
         max_uppercase: Maximale Anzahl von Großbuchstaben in der Gruppe
         max_digits: Maximale Anzahl von Ziffern in der Gruppe
+        random_bytes: Strom von Zufallsbytes (optional, sonst wird ein eigener angelegt)
         
     Returns:
         Eine Zeichenkette mit zufälligen Zeichen
@@ -35,19 +78,36 @@ def generate_group(length: int = 6, max_uppercase: int = 2, max_digits: int = 1)
     if max_uppercase + max_digits > length:
         raise ValueError("Die Summe aus max_uppercase und max_digits darf length nicht überschreiten")
     
+    # Anzahlen und Mischindizes werden aus einzelnen Bytes gezogen (höchstens 256 Werte)
+    if length > 255:
+        raise ValueError("length darf 255 nicht überschreiten")
+    
+    if length == 0:
+        return ''
+        
+    if random_bytes is None:
+        random_bytes = _random_bytes(2 * length)
+    
     # Entscheiden, wie viele von jedem Zeichentyp verwendet werden
-    num_uppercase = random.randint(0, max_uppercase)
-    num_digits = random.randint(0, max_digits)
+    # (jeweils gleichverteilt zwischen 0 und dem Maximum)
+    num_uppercase = _random_index(random_bytes, max_uppercase + 1)
+    num_digits = _random_index(random_bytes, max_digits + 1)
     num_lowercase = length - num_uppercase - num_digits
     
     # Zeichen für jede Kategorie generieren
-    uppercase_chars = random.choices(string.ascii_uppercase, k=num_uppercase)
-    digit_chars = random.choices(string.digits, k=num_digits)
-    lowercase_chars = random.choices(string.ascii_lowercase, k=num_lowercase)
+    all_chars = []
+    for alphabet, count in (
+        (string.ascii_uppercase, num_uppercase),
+        (string.digits, num_digits),
+        (string.ascii_lowercase, num_lowercase)
+    ):
+        for _ in range(count):
+            all_chars.append(alphabet[_random_index(random_bytes, len(alphabet))])
     
-    # Alle Zeichen kombinieren und mischen
-    all_chars = uppercase_chars + digit_chars + lowercase_chars
-    random.shuffle(all_chars)
+    # Alle Zeichen mischen (Fisher-Yates), damit jede Stelle gleichverteilt ist
+    for i in range(length - 1, 0, -1):
+        j = _random_index(random_bytes, i + 1)
+        all_chars[i], all_chars[j] = all_chars[j], all_chars[i]
     
     # Als String zurückgeben
     return ''.join(all_chars)
@@ -73,8 +133,11 @@ def generate_password(
     Returns:
         Ein Passwort bestehend aus mehreren Zeichengruppen
     """
+    # Zufallsbytes für alle Gruppen gemeinsam anfordern
+    random_bytes = _random_bytes(group_length * num_groups * 2)
+    
     groups = [
-        generate_group(group_length, max_uppercase, max_digits)
+        generate_group(group_length, max_uppercase, max_digits, random_bytes)
         for _ in range(num_groups)
     ]
     
@@ -12,12 +12,57 @@ Dieses Programm implementiert die Pomodoro-Technik mit anpassbaren
 Arbeits- und Pausenzeiten, inklusive längerer Pausen nach mehreren Arbeitszyklen.
 """
 
+import io
+import json
 import sys
 import time
 import os
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, Tuple, Optional
 from datetime import datetime, timedelta
 
+try:
+    # Zeilenbearbeitung, Eingabeverlauf und Tab-Vervollständigung für input()
+    import readline
+except ImportError:  # z. B. unter Windows
+    readline = None
+
+
+# Datei, in der der Zustand einer laufenden Phase gesichert wird
+STATE_FILE = os.path.expanduser("~/.pomodoro_state.json")
+
+# Abstand zwischen zwei Sicherungen des Zustands (in Sekunden)
+STATE_SAVE_INTERVAL = 10
+
+# Alle möglichen Zustände des Fortschrittsbalkens samt Zeilenanfang "\r[" und
+# Abschluss "] ", einmalig vorberechnet und bereits als ASCII-Bytes kodiert
+_BAR_LENGTH = 30
+_BAR_BYTES = tuple(
+    ("\r[" + "=" * filled + ">" + " " * (_BAR_LENGTH - filled - 1) + "] ").encode("ascii")
+    for filled in range(_BAR_LENGTH)
+)
+
+# Restzeit-Anzeige (MM:SS) für alle Sekunden bis zu vier Stunden, einmalig vorberechnet;
+# längere Phasen werden oberhalb dieser Grenze bei Bedarf formatiert
+_TIMER_CACHE_SECONDS = 4 * 60 * 60
+_TIMER_BYTES = tuple(
+    f"{s // 60:02d}:{s % 60:02d}".encode("ascii") for s in range(_TIMER_CACHE_SECONDS + 1)
+)
+
+
+def _timer_bytes(seconds: int) -> bytes:
+    """
+    Gibt die Restzeit als MM:SS in ASCII-Bytes zurück.
+    
+    Args:
+        seconds: Verbleibende Sekunden
+        
+    Returns:
+        Die formatierte Restzeit
+    """
+    if seconds <= _TIMER_CACHE_SECONDS:
+        return _TIMER_BYTES[seconds]
+    return f"{seconds // 60:02d}:{seconds % 60:02d}".encode("ascii")
+
 
 class PomodoroTimer:
     """Klasse zur Verwaltung eines Pomodoro-Timers."""
@@ -55,17 +100,64 @@ class PomodoroTimer:
         self.total_cycles_completed = 0
         self.current_phase = "work"
         
+        # Während der Timer läuft, wird stdout nur noch gezielt an den Phasengrenzen
+        # geleert statt nach jeder Zeile (nur bei zeilengepuffertem Terminal nötig)
+        line_buffering = getattr(sys.stdout, "line_buffering", False)
+        if line_buffering:
+            sys.stdout.reconfigure(line_buffering=False)
+            
         try:
-            self._run_timer_loop()
+            # Eine unterbrochene Phase der letzten Sitzung auf Wunsch fortsetzen
+            # (auch Strg+C bei der Rückfrage bricht sauber ab)
+            resume_seconds = self._ask_resume()
+            self._run_timer_loop(resume_seconds)
         except KeyboardInterrupt:
             print("\nTimer unterbrochen.")
             self.is_running = False
+        finally:
+            # Stellt die ursprüngliche Pufferung wieder her und leert dabei stdout
+            if line_buffering:
+                sys.stdout.reconfigure(line_buffering=True)
+            
+    def _ask_resume(self) -> Optional[int]:
+        """
+        Fragt nach, ob eine gesicherte, unterbrochene Phase fortgesetzt werden soll.
+        
+        Returns:
+            Verbleibende Sekunden der fortzusetzenden Phase oder None für einen Neustart
+        """
+        resume_seconds = self._load_state()
+        if resume_seconds is None:
+            return None
+            
+        mins, secs = divmod(resume_seconds, 60)
+        try:
+            answer = input(
+                f"\nUnterbrochene Sitzung fortsetzen (noch {mins:02d}:{secs:02d})? (j/n): "
+            ).strip().lower()
+        except EOFError:
+            answer = "n"
+            
+        if answer in ('j', 'ja', 'y', 'yes'):
+            return resume_seconds
             
-    def _run_timer_loop(self) -> None:
-        """Führt die Hauptschleife des Timers aus."""
+        # Neu beginnen und den gesicherten Zustand verwerfen
+        self._clear_state()
+        self.current_cycle = 0
+        self.total_cycles_completed = 0
+        self.current_phase = "work"
+        return None
+        
+    def _run_timer_loop(self, resume_seconds: Optional[int] = None) -> None:
+        """
+        Führt die Hauptschleife des Timers aus.
+        
+        Args:
+            resume_seconds: Verbleibende Sekunden der ersten Phase (optional, zum Fortsetzen)
+        """
         while self.is_running:
             if self.current_phase == "work":
-                self._run_phase("Arbeitsphase", self.work_duration)
+                self._run_phase("Arbeitsphase", self.work_duration, resume_seconds)
                 self.total_cycles_completed += 1
                 self.current_cycle += 1
                 
@@ -77,48 +169,175 @@ class PomodoroTimer:
                     self.current_phase = "short_break"
                     
             elif self.current_phase == "short_break":
-                self._run_phase("Kurze Pause", self.short_break_duration)
+                self._run_phase("Kurze Pause", self.short_break_duration, resume_seconds)
                 self.current_phase = "work"
                 
             elif self.current_phase == "long_break":
-                self._run_phase("Lange Pause", self.long_break_duration)
+                self._run_phase("Lange Pause", self.long_break_duration, resume_seconds)
                 self.current_phase = "work"
                 
-    def _run_phase(self, phase_name: str, duration_minutes: int) -> None:
+            # Nur die erste Phase wird fortgesetzt, alle weiteren laufen vollständig
+            resume_seconds = None
+            
+    def _phase_durations(self) -> Dict[str, int]:
+        """
+        Gibt die Dauer jeder Phase zurück.
+        
+        Returns:
+            Dictionary mit der Dauer in Minuten je Phase
+        """
+        return {
+            "work": self.work_duration,
+            "short_break": self.short_break_duration,
+            "long_break": self.long_break_duration
+        }
+        
+    def _save_state(self, remaining_seconds: int) -> None:
+        """
+        Sichert den Zustand der laufenden Phase, damit sie nach einer
+        Unterbrechung fortgesetzt werden kann.
+        
+        Args:
+            remaining_seconds: Verbleibende Sekunden der aktuellen Phase
+        """
+        state = {
+            "phase": self.current_phase,
+            "remaining": remaining_seconds,
+            "cycle": self.current_cycle,
+            "total": self.total_cycles_completed,
+            "ts": time.time()
+        }
+        
+        # Erst in eine temporäre Datei schreiben und dann ersetzen,
+        # damit nie eine halb geschriebene Datei zurückbleibt
+        tmp_file = STATE_FILE + ".tmp"
+        try:
+            with open(tmp_file, "w", encoding="utf-8") as f:
+                json.dump(state, f)
+            os.replace(tmp_file, STATE_FILE)
+        except OSError:
+            pass  # Ohne Sicherung läuft der Timer trotzdem weiter
+            
+    def _load_state(self) -> Optional[int]:
+        """
+        Lädt den gesicherten Zustand einer unterbrochenen Phase.
+        
+        Der Zustand wird nur übernommen, wenn er zur aktuellen Einstellung passt
+        und die Unterbrechung kürzer als die Dauer der Phase zurückliegt.
+        
+        Returns:
+            Verbleibende Sekunden der fortzusetzenden Phase oder None
+        """
+        try:
+            with open(STATE_FILE, encoding="utf-8") as f:
+                state = json.load(f)
+                
+            phase = state["phase"]
+            remaining_seconds = int(state["remaining"])
+            cycle = int(state["cycle"])
+            total = int(state["total"])
+            timestamp = float(state["ts"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+            
+        durations = self._phase_durations()
+        if phase not in durations:
+            return None
+            
+        duration_seconds = durations[phase] * 60
+        if not 0 < remaining_seconds <= duration_seconds:
+            return None
+        if time.time() - timestamp >= duration_seconds:
+            return None
+            
+        self.current_phase = phase
+        self.current_cycle = cycle
+        self.total_cycles_completed = total
+        return remaining_seconds
+        
+    def _clear_state(self) -> None:
+        """Entfernt den gesicherten Zustand, nachdem eine Phase regulär beendet wurde."""
+        try:
+            os.remove(STATE_FILE)
+        except OSError:
+            pass
+            
+    def _run_phase(
+        self,
+        phase_name: str,
+        duration_minutes: int,
+        remaining_seconds: Optional[int] = None
+    ) -> None:
         """
         Führt eine einzelne Phase (Arbeit oder Pause) aus.
         
         Args:
             phase_name: Name der Phase zur Anzeige
             duration_minutes: Dauer der Phase in Minuten
+            remaining_seconds: Verbleibende Sekunden beim Fortsetzen (optional)
         """
         duration_seconds = duration_minutes * 60
-        end_time = datetime.now() + timedelta(minutes=duration_minutes)
+        if remaining_seconds is None:
+            remaining_seconds = duration_seconds
+        end_time = datetime.now() + timedelta(seconds=remaining_seconds)
         
-        print(f"\n{phase_name} gestartet ({duration_minutes} Minuten)")
-        print(f"Ende um: {end_time.strftime('%H:%M:%S')}")
-        
-        # Fortschrittsanzeige
-        for remaining_seconds in range(duration_seconds, 0, -1):
+        if remaining_seconds < duration_seconds:
             mins, secs = divmod(remaining_seconds, 60)
-            timer_str = f"{mins:02d}:{secs:02d}"
-            
-            # Fortschrittsbalken berechnen
-            progress = (duration_seconds - remaining_seconds) / duration_seconds
-            bar_length = 30
-            bar = "=" * int(bar_length * progress) + ">" + " " * (bar_length - int(bar_length * progress) - 1)
-            
-            # Status ausgeben und Cursor zurücksetzen
-            sys.stdout.write(f"\r[{bar}] {timer_str}")
-            sys.stdout.flush()
-            time.sleep(1)
+            print(f"\n{phase_name} fortgesetzt (noch {mins:02d}:{secs:02d} von {duration_minutes} Minuten)")
+        else:
+            print(f"\n{phase_name} gestartet ({duration_minutes} Minuten)")
+        print(f"Ende um: {end_time.hour:02d}:{end_time.minute:02d}:{end_time.second:02d}")
+        
+        # Bisherige Ausgabe leeren; die Fortschrittsanzeige schreibt danach ungepuffert
+        # direkt in den Dateideskriptor von stdout (sofern vorhanden, in IDLE z. B. nicht)
+        sys.stdout.flush()
+        try:
+            fd = sys.stdout.fileno()
+        except (AttributeError, ValueError, io.UnsupportedOperation):
+            fd = None
+        
+        # Fortschrittsanzeige; alle Ticks beziehen sich auf denselben Startzeitpunkt,
+        # damit sich Verzögerungen einzelner Sekunden nicht aufsummieren
+        start = time.monotonic() - (duration_seconds - remaining_seconds)
+        ticks = 0
+        try:
+            while remaining_seconds > 0:
+                # Fortschrittsbalken nachschlagen
+                progress = (duration_seconds - remaining_seconds) / duration_seconds
+                line = _BAR_BYTES[int(_BAR_LENGTH * progress)] + _timer_bytes(remaining_seconds)
+                
+                # Status ausgeben und Cursor zurücksetzen (ein einziger Systemaufruf)
+                if fd is not None:
+                    os.write(fd, line)
+                else:
+                    sys.stdout.write(line.decode("ascii"))
+                    sys.stdout.flush()
+                    
+                # Zustand regelmäßig sichern
+                if ticks % STATE_SAVE_INTERVAL == 0:
+                    self._save_state(remaining_seconds)
+                ticks += 1
+                
+                # Bis zur nächsten vollen Sekunde seit Phasenbeginn schlafen
+                next_tick = start + (duration_seconds - remaining_seconds) + 1
+                time.sleep(max(0.0, next_tick - time.monotonic()))
+                remaining_seconds = duration_seconds - int(time.monotonic() - start)
+                
+        except KeyboardInterrupt:
+            # Genauen Stand sichern, damit beim Fortsetzen keine Sekunden verloren gehen
+            remaining_seconds = duration_seconds - int(time.monotonic() - start)
+            if remaining_seconds > 0:
+                self._save_state(remaining_seconds)
+            raise
             
         # Phase abgeschlossen
+        self._clear_state()
         sys.stdout.write("\r" + " " * 50 + "\r")  # Zeile löschen
         print(f"{phase_name} abgeschlossen!")
         
-        # Benachrichtigung ausgeben
+        # Benachrichtigung ausgeben und alle Zeilen der Phase auf einmal anzeigen
         self._notify(f"{phase_name} abgeschlossen!")
+        sys.stdout.flush()
         
     def _notify(self, message: str) -> None:
         """
@@ -138,6 +357,29 @@ class PomodoroTimer:
         # anderen plattformspezifischen Methoden
 
 
+# Statistikvorlage und Hilfetext werden nur einmal aufgebaut
+_STATS_TEMPLATE = """
+Pomodoro-Statistik
+==================
+Abgeschlossene Arbeitszyklen: {cycles}
+Gesamte Arbeitszeit: {total} Minuten
+             ({hours} Stunden, {minutes} Minuten)
+"""
+
+_HELP_TEXT = """
+Pomodoro-Timer Hilfe
+===================
+Befehle:
+  start       - Timer mit Standardeinstellungen starten
+  einstellen  - Timer-Einstellungen anpassen
+  hilfe       - Diese Hilfeübersicht anzeigen
+  exit/quit   - Programm beenden
+
+Während der Timer läuft:
+  Strg+C drücken, um den Timer zu unterbrechen
+"""
+
+
 def print_stats(timer: PomodoroTimer) -> None:
     """
     Gibt Statistiken über die abgeschlossenen Pomodoro-Zyklen aus.
@@ -147,24 +389,39 @@ def print_stats(timer: PomodoroTimer) -> None:
     """
     total_work_time = timer.total_cycles_completed * timer.work_duration
     
-    print("\nPomodoro-Statistik")
-    print("==================")
-    print(f"Abgeschlossene Arbeitszyklen: {timer.total_cycles_completed}")
-    print(f"Gesamte Arbeitszeit: {total_work_time} Minuten")
-    print(f"             ({total_work_time // 60} Stunden, {total_work_time % 60} Minuten)")
+    sys.stdout.write(_STATS_TEMPLATE.format(
+        cycles=timer.total_cycles_completed,
+        total=total_work_time,
+        hours=total_work_time // 60,
+        minutes=total_work_time % 60
+    ))
 
 
 def print_help() -> None:
     """Zeigt die Hilfeübersicht für den Pomodoro-Timer an."""
-    print("\nPomodoro-Timer Hilfe")
-    print("===================")
-    print("Befehle:")
-    print("  start       - Timer mit Standardeinstellungen starten")
-    print("  einstellen  - Timer-Einstellungen anpassen")
-    print("  hilfe       - Diese Hilfeübersicht anzeigen")
-    print("  exit/quit   - Programm beenden")
-    print("\nWährend der Timer läuft:")
-    print("  Strg+C drücken, um den Timer zu unterbrechen")
+    sys.stdout.write(_HELP_TEXT)
+
+
+# Befehle für die Tab-Vervollständigung
+COMMANDS = (
+    'start', 'starten', 'los', 'einstellen', 'konfigurieren', 'config',
+    'hilfe', 'help', 'stats', 'statistik', 'exit', 'quit', 'beenden'
+)
+
+
+def _complete_command(text: str, state: int) -> Optional[str]:
+    """
+    Vervollständigt einen Befehl für readline.
+    
+    Args:
+        text: Bisher eingegebener Text
+        state: Index des gewünschten Treffers
+        
+    Returns:
+        Der passende Befehl oder None, wenn es keine weiteren Treffer gibt
+    """
+    matches = [command for command in COMMANDS if command.startswith(text)]
+    return matches[state] if state < len(matches) else None
 
 
 def configure_timer() -> Tuple[int, int, int, int]:
@@ -197,6 +454,14 @@ def main() -> int:
     print("Pomodoro-Timer")
     print("'hilfe' für Hilfeübersicht, 'exit' zum Beenden")
     
+    # Befehle per Tab vervollständigen (macOS verwendet libedit statt GNU readline)
+    if readline is not None:
+        readline.set_completer(_complete_command)
+        if "libedit" in (readline.__doc__ or ""):
+            readline.parse_and_bind("bind ^I rl_complete")
+        else:
+            readline.parse_and_bind("tab: complete")
+    
     # Standardeinstellungen
     work_duration = 25
     short_break = 5
@@ -12,16 +12,77 @@ Dieses Programm ermöglicht dem Benutzer, Schere, Stein, Papier gegen
 den Computer zu spielen und den Spielstand zu verfolgen.
 """
 
+import itertools
 import random
 import sys
 import time
-from typing import Tuple, Dict, List, Optional
+from typing import Tuple, Dict, List
+
+
+def _baue_zug_zuordnung(zuege: List[str], zug_alternativen: Dict[str, List[str]]) -> Dict[str, int]:
+    """
+    Ordnet jeder zulässigen Eingabe die Nummer ihres Standardzugs zu.
+    
+    Args:
+        zuege: Namen der Standardzüge in der Reihenfolge ihrer Nummern
+        zug_alternativen: Alternative Eingaben je Standardzug
+        
+    Returns:
+        Dictionary von Eingabe auf Zugnummer
+    """
+    zuordnung = {}
+    for nummer, zug in enumerate(zuege):
+        zuordnung[zug] = nummer
+        for alternative in zug_alternativen[zug]:
+            zuordnung[alternative] = nummer
+            
+    return zuordnung
+
+
+def _baue_ascii_paare(zuege: List[str], zuege_ascii: Dict[str, str]) -> Tuple[bytes, ...]:
+    """
+    Formatiert die ASCII-Art aller Zugpaare einmalig nebeneinander vor.
+    
+    Args:
+        zuege: Namen der Standardzüge in der Reihenfolge ihrer Nummern
+        zuege_ascii: ASCII-Art je Zug
+        
+    Returns:
+        Fertig kodierte Ausgabe je Zugpaar, Index: Spielerzug * Anzahl Züge + Computerzug
+    """
+    paare = []
+    for spieler_zug, computer_zug in itertools.product(zuege, repeat=2):
+        # Splitten und Zeilen für Nebeneinanderstellung vorbereiten
+        spieler_linien = zuege_ascii[spieler_zug].split("\n")
+        computer_linien = zuege_ascii[computer_zug].split("\n")
+        
+        # Maximale Anzahl an Zeilen bestimmen
+        max_zeilen = max(len(spieler_linien), len(computer_linien))
+        
+        # Ausgabe formatieren
+        zeilen = [
+            "\n" + "=" * 50,
+            "Spieler" + " " * 16 + "vs." + " " * 17 + "Computer",
+            "=" * 50
+        ]
+        
+        for i in range(max_zeilen):
+            spieler_linie = spieler_linien[i] if i < len(spieler_linien) else ""
+            computer_linie = computer_linien[i] if i < len(computer_linien) else ""
+            
+            # Gepolsterte Ausgabe
+            zeilen.append(f"{spieler_linie:<25}{computer_linie}")
+            
+        zeilen.append("=" * 50)
+        paare.append(("\n".join(zeilen) + "\n").encode("ascii"))
+        
+    return tuple(paare)
 
 
 class SchereSteinPapier:
     """Klasse zur Verwaltung eines Schere-Stein-Papier-Spiels."""
     
-    # Mögliche Züge
+    # Mögliche Züge; intern wird nur mit ihren Nummern (Index in ZUEGE) gerechnet
     ZUEGE = ["schere", "stein", "papier"]
     
     # Alternativen Eingaben für die Züge
@@ -31,6 +92,13 @@ class SchereSteinPapier:
         "papier": ["p", "pa", "paper"]
     }
     
+    # Ergebnis abhängig von (Spielerzug - Computerzug) % 3; im Kreis
+    # Schere -> Stein -> Papier schlägt jeder Zug seinen Vorgänger
+    _ERGEBNISSE = (0, 1, -1)
+    
+    # Zuordnung aller zulässigen Eingaben zur Nummer des Standardzugs
+    _ZUG_ZUORDNUNG = _baue_zug_zuordnung(ZUEGE, ZUG_ALTERNATIVEN)
+    
     # ASCII-Art für die Züge
     ZUEGE_ASCII = {
         "schere": """
@@ -58,6 +126,9 @@ class SchereSteinPapier:
         """
     }
     
+    # Vorformatierte Nebeneinanderdarstellung für alle Zugpaare
+    _ASCII_PAARE = _baue_ascii_paare(ZUEGE, ZUEGE_ASCII)
+    
     def __init__(self):
         """Initialisiert ein neues Schere-Stein-Papier-Spiel."""
         self.spieler_punkte = 0
@@ -67,6 +138,9 @@ class SchereSteinPapier:
         self.letzter_spieler_zug = None
         self.letzter_computer_zug = None
         
+        # Eigener Zufallsgenerator für die Computerzüge
+        self._rng = random.Random()
+        
     def ist_zulaessiger_zug(self, zug: str) -> bool:
         """
         Überprüft, ob ein Zug zulässig ist.
@@ -77,75 +151,48 @@ class SchereSteinPapier:
         Returns:
             True, wenn der Zug zulässig ist, sonst False
         """
-        zug = zug.lower()
-        
-        # Direkter Zug
-        if zug in self.ZUEGE:
-            return True
-            
-        # Alternative Eingabe
-        for echte_zuege, alternativen in self.ZUG_ALTERNATIVEN.items():
-            if zug in alternativen:
-                return True
-                
-        return False
+        return zug.lower() in self._ZUG_ZUORDNUNG
         
-    def normalisiere_zug(self, zug: str) -> str:
+    def normalisiere_zug(self, zug: str) -> int:
         """
-        Normalisiert einen Zug auf einen der Standardzüge.
+        Normalisiert einen Zug auf die Nummer eines der Standardzüge.
         
         Args:
             zug: Der zu normalisierende Zug
             
         Returns:
-            Der normalisierte Zug
-        """
-        zug = zug.lower()
-        
-        # Direkter Zug
-        if zug in self.ZUEGE:
-            return zug
+            Die Nummer des Zuges (Index in ZUEGE)
             
-        # Alternative Eingabe
-        for echter_zug, alternativen in self.ZUG_ALTERNATIVEN.items():
-            if zug in alternativen:
-                return echter_zug
-                
-        # Sollte nicht vorkommen, wenn ist_zulaessiger_zug vorher aufgerufen wurde
-        return zug
+        Raises:
+            ValueError: Wenn der Zug nicht zulässig ist
+        """
+        try:
+            return self._ZUG_ZUORDNUNG[zug.lower()]
+        except KeyError:
+            raise ValueError(f"Ungültiger Zug: {zug}") from None
         
-    def computer_zug(self) -> str:
+    def computer_zug(self) -> int:
         """
         Generiert einen zufälligen Zug für den Computer.
         
         Returns:
-            Der Zug des Computers
+            Die Nummer des Computerzugs
         """
-        return random.choice(self.ZUEGE)
+        return self._rng.randrange(len(self.ZUEGE))
         
-    def bestimme_gewinner(self, spieler_zug: str, computer_zug: str) -> int:
+    def bestimme_gewinner(self, spieler_zug: int, computer_zug: int) -> int:
         """
         Bestimmt den Gewinner einer Runde.
         
         Args:
-            spieler_zug: Der Zug des Spielers
-            computer_zug: Der Zug des Computers
+            spieler_zug: Die Nummer des Spielerzugs
+            computer_zug: Die Nummer des Computerzugs
             
         Returns:
             1 für Spielersieg, -1 für Computersieg, 0 für Unentschieden
         """
-        # Unentschieden
-        if spieler_zug == computer_zug:
-            return 0
-            
-        # Spieler gewinnt
-        if ((spieler_zug == "schere" and computer_zug == "papier") or
-            (spieler_zug == "stein" and computer_zug == "schere") or
-            (spieler_zug == "papier" and computer_zug == "stein")):
-            return 1
-            
-        # Computer gewinnt
-        return -1
+        # 0 -> Unentschieden, 1 -> Spieler gewinnt, 2 -> Computer gewinnt
+        return self._ERGEBNISSE[(spieler_zug - computer_zug) % 3]
         
     def aktualisiere_punktestand(self, ergebnis: int) -> None:
         """
@@ -189,13 +236,15 @@ class SchereSteinPapier:
         # Punktestand aktualisieren
         self.aktualisiere_punktestand(ergebnis)
         
-        # Nachricht generieren
+        # Nachricht generieren (erst hier werden die Zugnummern zu Namen)
+        spieler_name = self.ZUEGE[spieler_zug]
+        computer_name = self.ZUEGE[computer_zug]
         if ergebnis == 1:
-            nachricht = f"Du gewinnst! {spieler_zug.capitalize()} schlägt {computer_zug}."
+            nachricht = f"Du gewinnst! {spieler_name.capitalize()} schlägt {computer_name}."
         elif ergebnis == -1:
-            nachricht = f"Du verlierst! {computer_zug.capitalize()} schlägt {spieler_zug}."
+            nachricht = f"Du verlierst! {computer_name.capitalize()} schlägt {spieler_name}."
         else:
-            nachricht = f"Unentschieden! Beide wählen {spieler_zug}."
+            nachricht = f"Unentschieden! Beide wählen {spieler_name}."
             
         return ergebnis, nachricht
         
@@ -213,69 +262,78 @@ class SchereSteinPapier:
             "runden": self.runden
         }
         
-    def zeige_ascii_art(self, spieler_zug: str, computer_zug: str) -> None:
+    def zeige_ascii_art(self, spieler_zug: int, computer_zug: int) -> None:
         """
         Zeigt ASCII-Art für die Züge an.
         
         Args:
-            spieler_zug: Der Zug des Spielers
-            computer_zug: Der Zug des Computers
+            spieler_zug: Die Nummer des Spielerzugs
+            computer_zug: Die Nummer des Computerzugs
         """
-        spieler_ascii = self.ZUEGE_ASCII.get(spieler_zug, "")
-        computer_ascii = self.ZUEGE_ASCII.get(computer_zug, "")
-        
-        # Splitten und Zeilen für Nebeneinanderstellung vorbereiten
-        spieler_linien = spieler_ascii.split("\n")
-        computer_linien = computer_ascii.split("\n")
-        
-        # Maximale Anzahl an Zeilen bestimmen
-        max_zeilen = max(len(spieler_linien), len(computer_linien))
-        
-        # Ausgabe formatieren
-        print("\n" + "=" * 50)
-        print("Spieler" + " " * 16 + "vs." + " " * 17 + "Computer")
-        print("=" * 50)
+        ausgabe = self._ASCII_PAARE[spieler_zug * len(self.ZUEGE) + computer_zug]
         
-        for i in range(max_zeilen):
-            spieler_linie = spieler_linien[i] if i < len(spieler_linien) else ""
-            computer_linie = computer_linien[i] if i < len(computer_linien) else ""
-            
-            # Gepolsterte Ausgabe
-            print(f"{spieler_linie:<25}{computer_linie}")
-            
-        print("=" * 50)
+        puffer = getattr(sys.stdout, "buffer", None)
+        if puffer is None:
+            # z. B. in IDLE, wo stdout keinen Byte-Puffer besitzt
+            sys.stdout.write(ausgabe.decode("ascii"))
+        else:
+            # Textpuffer zuerst leeren, damit die Reihenfolge der Ausgaben erhalten bleibt
+            sys.stdout.flush()
+            puffer.write(ausgabe)
         
     def zeige_punktestand(self) -> None:
         """Zeigt den aktuellen Punktestand an."""
-        print("\nPunktestand:")
-        print(f"Spieler: {self.spieler_punkte}  |  Computer: {self.computer_punkte}  |  Unentschieden: {self.unentschieden}")
-        print(f"Gespielte Runden: {self.runden}")
+        zeilen = [
+            "\nPunktestand:",
+            f"Spieler: {self.spieler_punkte}  |  Computer: {self.computer_punkte}  |  Unentschieden: {self.unentschieden}",
+            f"Gespielte Runden: {self.runden}"
+        ]
+        sys.stdout.write("\n".join(zeilen) + "\n")
 
 
 def animiere_countdown() -> None:
     """Zeigt einen animierten Countdown an."""
     print("\nSchere, Stein, Papier...")
-    for i in range(3, 0, -1):
-        print(f"{i}...")
-        time.sleep(0.5)
+    
+    # Feste Zeitpunkte ab Start, damit sich die Wartezeiten nicht aufsummieren
+    start = time.monotonic()
+    for schritt, i in enumerate(range(3, 0, -1), 1):
+        print(f"{i}...", flush=True)
+        time.sleep(max(0.0, start + schritt * 0.5 - time.monotonic()))
     print("Los!")
 
 
+# Hilfetext und Statistikvorlage werden nur einmal aufgebaut
+_HILFETEXT = """
+Schere, Stein, Papier - Hilfe
+============================
+Befehle:
+  schere/s       - Wähle Schere
+  stein/st       - Wähle Stein
+  papier/p       - Wähle Papier
+  statistik      - Zeigt die Spielstatistik an
+  hilfe          - Diese Hilfeübersicht anzeigen
+  exit/quit      - Spiel beenden
+
+Spielregeln:
+  - Schere schlägt Papier
+  - Stein schlägt Schere
+  - Papier schlägt Stein
+"""
+
+_STATISTIK_VORLAGE = """
+Spielstatistik
+==============
+Spieler: {spieler_punkte} Punkte
+Computer: {computer_punkte} Punkte
+Unentschieden: {unentschieden}
+Gespielte Runden: {runden}
+"""
+
+
 def print_help() -> None:
     """Zeigt die Hilfeübersicht für das Spiel an."""
-    print("\nSchere, Stein, Papier - Hilfe")
-    print("============================")
-    print("Befehle:")
-    print("  schere/s       - Wähle Schere")
-    print("  stein/st       - Wähle Stein")
-    print("  papier/p       - Wähle Papier")
-    print("  statistik      - Zeigt die Spielstatistik an")
-    print("  hilfe          - Diese Hilfeübersicht anzeigen")
-    print("  exit/quit      - Spiel beenden")
-    print("\nSpielregeln:")
-    print("  - Schere schlägt Papier")
-    print("  - Stein schlägt Schere")
-    print("  - Papier schlägt Stein")
+    sys.stdout.write(_HILFETEXT)
 
 
 def main() -> int:
@@ -309,27 +367,20 @@ def main() -> int:
                 
             elif user_input in ['statistik', 'stats', 'punkte', 'score']:
                 statistik = spiel.get_statistik()
-                
-                print("\nSpielstatistik")
-                print("==============")
-                print(f"Spieler: {statistik['spieler_punkte']} Punkte")
-                print(f"Computer: {statistik['computer_punkte']} Punkte")
-                print(f"Unentschieden: {statistik['unentschieden']}")
-                print(f"Gespielte Runden: {statistik['runden']}")
+                ausgabe = _STATISTIK_VORLAGE.format(**statistik)
                 
                 if statistik['runden'] > 0:
                     gewinnrate = (statistik['spieler_punkte'] / statistik['runden']) * 100
-                    print(f"Deine Gewinnrate: {gewinnrate:.1f}%")
+                    ausgabe += f"Deine Gewinnrate: {gewinnrate:.1f}%\n"
+                    
+                sys.stdout.write(ausgabe)
                     
             elif spiel.ist_zulaessiger_zug(user_input):
-                # Zug normalisieren
-                zug = spiel.normalisiere_zug(user_input)
-                
                 # Countdown Animation
                 animiere_countdown()
                 
-                # Spielrunde durchführen
-                ergebnis, nachricht = spiel.spielrunde(zug)
+                # Spielrunde durchführen (der Zug wird dabei normalisiert)
+                ergebnis, nachricht = spiel.spielrunde(user_input)
                 
                 # ASCII-Art anzeigen
                 spiel.zeige_ascii_art(spiel.letzter_spieler_zug, spiel.letzter_computer_zug)
@@ -12,60 +12,99 @@ Dieses Programm bietet grundlegende arithmetische Operationen mit Klammerunterst
 und fungiert als Einstiegsprojekt für Python-Anfänger.
 """
 
-import sys
+import ast
 import re
-from typing import Dict, List, Tuple, Union, Optional
+import sys
+from typing import Optional, Union
+
+try:
+    # Zeilenbearbeitung und Eingabeverlauf für input(); der Import allein genügt
+    import readline  # noqa: F401
+except ImportError:  # z. B. unter Windows
+    readline = None
 
+# Ganze Zahlen bleiben int, erst eine Division ergibt float
+Zahl = Union[int, float]
 
-def add(a: float, b: float) -> float:
+
+def add(a: Zahl, b: Zahl) -> Zahl:
     """Addiert zwei Zahlen."""
     return a + b
 
 
-def subtract(a: float, b: float) -> float:
+def subtract(a: Zahl, b: Zahl) -> Zahl:
     """Subtrahiert b von a."""
     return a - b
 
 
-def multiply(a: float, b: float) -> float:
+def multiply(a: Zahl, b: Zahl) -> Zahl:
     """Multipliziert zwei Zahlen."""
     return a * b
 
 
-def divide(a: float, b: float) -> Optional[float]:
+def divide(a: Zahl, b: Zahl) -> float:
     """
     Dividiert a durch b.
     
-    Returns:
-        Das Ergebnis der Division oder None, wenn durch 0 geteilt wird
+    Division durch 0 wird bereits beim Auswerten des Ausdrucks abgefangen.
     """
-    if b == 0:
-        print("Fehler: Division durch Null ist nicht erlaubt.")
-        return None
     return a / b
 
 
-def tokenize(expression: str) -> List[str]:
+# Erlaubte Zeichen in der Eingabe; schließt Python-eigene Zahlenschreibweisen
+# wie 0x10, 1_000 oder 1e5 aus, die der Parser sonst akzeptieren würde
+_ERLAUBTE_ZEICHEN = frozenset("0123456789.+-*/() \t")
+
+# Führende Nullen ganzer Zahlen (z. B. 007), die Python als Syntaxfehler ansieht
+_FUEHRENDE_NULLEN = re.compile(r'(?<![\d.])0+(?=\d)')
+
+# Erlaubte Rechenoperationen im Syntaxbaum
+_OPERATIONEN = {ast.Add: add, ast.Sub: subtract, ast.Mult: multiply, ast.Div: divide}
+
+
+def _auswerten(node: ast.AST) -> Zahl:
     """
-    Zerlegt einen mathematischen Ausdruck in Tokens.
+    Wertet einen Knoten des Syntaxbaums aus.
+    
+    Erlaubt sind nur Zahlen, die Grundrechenarten und das einstellige Minus;
+    alle anderen Python-Ausdrücke werden abgelehnt.
     
     Args:
-        expression: Der zu zerlegende mathematische Ausdruck
+        node: Der auszuwertende Knoten
         
     Returns:
-        Liste der erkannten Tokens (Zahlen, Operatoren, Klammern)
+        Der Wert des Knotens
     """
-    # Alle Leerzeichen entfernen
-    expression = expression.replace(" ", "")
-    
-    # Regex-Muster für Zahlen und Operatoren
-    pattern = r'(\d*\.\d+|\d+|[\+\-\*/\(\)])'
-    tokens = re.findall(pattern, expression)
-    
-    return tokens
+    # Zweistellige Operation
+    if isinstance(node, ast.BinOp) and type(node.op) in _OPERATIONEN:
+        left = _auswerten(node.left)
+        right = _auswerten(node.right)
+        if isinstance(node.op, ast.Div) and right == 0:
+            raise ValueError("Division durch Null ist nicht erlaubt.")
+        return _OPERATIONEN[type(node.op)](left, right)
+        
+    # Vorzeichen
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.USub):
+        return -_auswerten(node.operand)
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.UAdd):
+        return _auswerten(node.operand)
+        
+    # Zahl (Python 3.7 erzeugt dafür noch ast.Num statt ast.Constant)
+    if isinstance(node, ast.Constant):
+        wert = node.value
+    elif sys.version_info < (3, 8) and isinstance(node, ast.Num):
+        wert = node.n
+    else:
+        raise ValueError("Nicht unterstützter Ausdruck")
+        
+    if type(wert) not in (int, float):
+        raise ValueError(f"Ungültiges Token: {wert!r}")
+    # Ganze Zahlen bleiben int, damit reine Ganzzahlausdrücke ohne
+    # Gleitkommarechnung auskommen; erst die Division liefert float
+    return wert
 
 
-def evaluate_expression(expression: str) -> Optional[float]:
+def evaluate_expression(expression: str) -> Optional[Zahl]:
     """
     Wertet einen mathematischen Ausdruck aus, der Klammern enthalten kann.
     
@@ -75,65 +114,22 @@ def evaluate_expression(expression: str) -> Optional[float]:
     Returns:
         Das Ergebnis der Berechnung oder None bei Fehlern
     """
-    tokens = tokenize(expression)
-    
-    def parse():
-        """
-        Rekursive Funktion zum Analysieren und Auswerten des Ausdrucks.
-        """
-        def parse_expression():
-            left = parse_term()
-            while tokens and tokens[0] in ['+', '-']:
-                op = tokens.pop(0)
-                right = parse_term()
-                if op == '+':
-                    left = left + right
-                else:  # op == '-'
-                    left = left - right
-            return left
-            
-        def parse_term():
-            left = parse_factor()
-            while tokens and tokens[0] in ['*', '/']:
-                op = tokens.pop(0)
-                right = parse_factor()
-                if op == '*':
-                    left = left * right
-                else:  # op == '/'
-                    if right == 0:
-                        raise ValueError("Division durch Null ist nicht erlaubt.")
-                    left = left / right
-            return left
-            
-        def parse_factor():
-            if not tokens:
-                raise ValueError("Unerwartetes Ende des Ausdrucks")
-                
-            token = tokens.pop(0)
-            
-            # Klammer auf
-            if token == '(':
-                value = parse_expression()
-                if not tokens or tokens.pop(0) != ')':
-                    raise ValueError("Fehlende schließende Klammer")
-                return value
-                
-            # Negative Zahl
-            elif token == '-':
-                return -parse_factor()
-                
-            # Zahl
-            else:
-                try:
-                    return float(token)
-                except ValueError:
-                    raise ValueError(f"Ungültiges Token: {token}")
-                    
-        return parse_expression()
-    
     try:
-        result = parse()
-        return result
+        # Nur Dezimalzahlen, Grundrechenarten und Klammern zulassen
+        for zeichen in expression:
+            if zeichen not in _ERLAUBTE_ZEICHEN:
+                raise ValueError(f"Ungültiges Zeichen: {zeichen!r}")
+                
+        # Das Zerlegen übernimmt der in C implementierte Python-Parser
+        expression = _FUEHRENDE_NULLEN.sub('', expression.strip())
+        baum = ast.parse(expression, mode='eval')
+        return _auswerten(baum.body)
+    except SyntaxError:
+        print("Fehler: Ungültiger Ausdruck")
+        return None
+    except RecursionError:
+        print("Fehler: Der Ausdruck ist zu tief verschachtelt.")
+        return None
     except ValueError as e:
         print(f"Fehler: {e}")
         return None
@@ -142,20 +138,31 @@ def evaluate_expression(expression: str) -> Optional[float]:
         return None
 
 
+# Hilfetext wird nur einmal aufgebaut
+_HILFETEXT = """
+Einfacher Taschenrechner
+------------------------
+Unterstützte Operationen:
+  + : Addition (z. B. 5 + 3)
+  - : Subtraktion (z. B. 5 - 3)
+  * : Multiplikation (z. B. 5 * 3)
+  / : Division (z. B. 5 / 3)
+  ( ) : Klammern für Vorrang (z. B. 2 * (3 + 4))
+
+Zahlen: ganze Zahlen und Dezimalzahlen mit Punkt, optional mit Vorzeichen
+        (z. B. 42, 3.5, -2 oder +7)
+
+Befehle:
+  help : Hilfeübersicht anzeigen
+  exit/quit : Programm beenden
+
+Format: Mathematischer Ausdruck (z. B. 5 + 3 * 2 oder (2 + 3) * 4)
+"""
+
+
 def print_help() -> None:
     """Zeigt die Hilfeübersicht für den Taschenrechner an."""
-    print("\nEinfacher Taschenrechner")
-    print("------------------------")
-    print("Unterstützte Operationen:")
-    print("  + : Addition (z. B. 5 + 3)")
-    print("  - : Subtraktion (z. B. 5 - 3)")
-    print("  * : Multiplikation (z. B. 5 * 3)")
-    print("  / : Division (z. B. 5 / 3)")
-    print("  ( ) : Klammern für Vorrang (z. B. 2 * (3 + 4))")
-    print("\nBefehle:")
-    print("  help : Hilfeübersicht anzeigen")
-    print("  exit/quit : Programm beenden")
-    print("\nFormat: Mathematischer Ausdruck (z. B. 5 + 3 * 2 oder (2 + 3) * 4)")
+    sys.stdout.write(_HILFETEXT)
 
 
 def main() -> int:
@@ -186,7 +193,7 @@ def main() -> int:
             
             if result is not None:
                 # Ausgabe ohne Nachkommastellen, wenn das Ergebnis ganzzahlig ist
-                if result == int(result):
+                if isinstance(result, float) and result.is_integer():
                     print(f"Ergebnis: {int(result)}")
                 else:
                     print(f"Ergebnis: {result}")
@@ -14,15 +14,61 @@ versucht, diese zu erraten. Bei jedem Versuch gibt es Hinweise.
 
 import random
 import sys
-import time
-import math
+from bisect import bisect_left
 from typing import Tuple, Optional, List
 
 
+def _ziffernsumme(n: int) -> int:
+    """
+    Berechnet die Ziffernsumme einer Zahl rein arithmetisch.
+    
+    Args:
+        n: Die Zahl (das Vorzeichen wird ignoriert)
+        
+    Returns:
+        Die Summe aller Ziffern
+    """
+    n = abs(n)
+    summe = 0
+    while n:
+        n, ziffer = divmod(n, 10)
+        summe += ziffer
+    return summe
+
+
+# Obergrenzen (einschließlich) der Abstandsstufen und der Hinweis je Stufe
+_ABSTANDS_GRENZEN = (5, 10, 20)
+_ABSTANDS_HINWEISE = (
+    "Du bist sehr nah dran!",
+    "Du kommst der Zahl näher.",
+    "Du bist noch etwas entfernt.",
+    "Du bist noch weit entfernt."
+)
+
+
+def _abstands_hinweis(differenz: int) -> str:
+    """
+    Formuliert einen Hinweis dazu, wie weit ein Tipp von der Geheimzahl entfernt ist.
+    
+    Args:
+        differenz: Betrag der Differenz zwischen Tipp und Geheimzahl
+        
+    Returns:
+        Der Hinweis als String
+    """
+    # bisect_left, damit ein Abstand genau auf einer Grenze noch zur engeren Stufe zählt
+    return _ABSTANDS_HINWEISE[bisect_left(_ABSTANDS_GRENZEN, differenz)]
+
+
+# Platzhalter im Hinweisvorrat für den Abstandshinweis, der vom jeweiligen Tipp abhängt
+_ABSTANDS_PLATZHALTER = object()
+
+
 class ZahlenRaten:
     """Klasse zum Verwalten des Zahlenratespiels."""
     
-    def __init__(self, min_zahl: int = 1, max_zahl: int = 100, max_versuche: int = 10):
+    def __init__(self, min_zahl: int = 1, max_zahl: int = 100, max_versuche: int = 10,
+                 seed: Optional[int] = None):
         """
         Initialisiert das Zahlenratespiel.
         
@@ -30,6 +76,7 @@ class ZahlenRaten:
             min_zahl: Untere Grenze des Zahlenbereichs
             max_zahl: Obere Grenze des Zahlenbereichs
             max_versuche: Maximale Anzahl an Versuchen
+            seed: Startwert des Zufallsgenerators für reproduzierbare Spiele (optional)
         """
         self.min_zahl = min_zahl
         self.max_zahl = max_zahl
@@ -41,12 +88,42 @@ class ZahlenRaten:
         self.gewonnen = False
         self.rateversuche = []
         
+        # Eigener Zufallsgenerator statt des globalen Zustands im random-Modul
+        self._rng = random.Random(seed)
+        
         # Spiel initialisieren
         self._neue_zahl_waehlen()
         
     def _neue_zahl_waehlen(self) -> None:
         """Wählt eine neue geheime Zahl für das Spiel aus."""
-        self.geheimzahl = random.randint(self.min_zahl, self.max_zahl)
+        self.geheimzahl = self._rng.randint(self.min_zahl, self.max_zahl)
+        
+        # Eigenschaften der Geheimzahl für die Hinweise nur einmal pro Spiel bestimmen
+        self._paritaet = "gerade" if self.geheimzahl % 2 == 0 else "ungerade"
+        self._teiler_hinweis = next(
+            (f"Die Zahl ist durch {t} teilbar." for t in (2, 3, 5) if self.geheimzahl % t == 0),
+            None
+        )
+        self._ziffernsumme = _ziffernsumme(self.geheimzahl)
+        self._erste_ziffer = str(abs(self.geheimzahl))[0]
+        zehnerstelle = (self.geheimzahl // 10) * 10
+        self._zehner_bereich = (zehnerstelle, zehnerstelle + 9)
+        
+        # Zusätzliche Hinweise in der Reihenfolge ihrer Freischaltung; der Index
+        # entspricht der Anzahl an Versuchen, ab der ein Hinweis gegeben wird
+        self._hinweis_vorrat = (
+            None,
+            None,
+            self._teiler_hinweis,
+            f"Es ist eine {self._paritaet} Zahl.",
+            _ABSTANDS_PLATZHALTER,
+            f"Die Ziffernsumme ist {self._ziffernsumme}.",
+            "Die Zahl liegt zwischen {} und {}.".format(*self._zehner_bereich)
+        )
+        
+        # Optimale Strategie wird erst bei Bedarf berechnet
+        self._optimale_strategie = None
+        
         self.versuche = 0
         self.punkte = 100
         self.verloren = False
@@ -71,7 +148,7 @@ class ZahlenRaten:
         differenz = abs(zahl - self.geheimzahl)
         
         # Punkte reduzieren basierend auf der Differenz und Anzahl der Versuche
-        punkte_abzug = min(10, max(1, int(differenz / 5))) + min(5, self.versuche)
+        punkte_abzug = min(10, max(1, differenz // 5)) + min(5, self.versuche)
         self.punkte = max(0, self.punkte - punkte_abzug)
         
         # Prüfen, ob die Zahl richtig ist
@@ -105,54 +182,24 @@ class ZahlenRaten:
         else:
             basis_hinweis = "Die gesuchte Zahl ist kleiner."
             
-        # Zusätzliche Hinweise basierend auf der Anzahl der Versuche
+        # Zusätzliche Hinweise: die ersten, die nach der bisherigen Anzahl der Versuche
+        # bereits freigeschaltet sind, aber nur bis zu 2 (um nicht zu viel zu verraten)
         zusatz_hinweise = []
-        
-        # Ab dem zweiten Versuch mehr Hinweise geben
-        if self.versuche >= 2:
-            # Hinweis zur Teilbarkeit
-            teiler = [2, 3, 5]
-            for t in teiler:
-                if self.geheimzahl % t == 0:
-                    zusatz_hinweise.append(f"Die Zahl ist durch {t} teilbar.")
-                    break  # Nur einen Teilbarkeitshinweis geben
+        for hinweis in self._hinweis_vorrat[:self.versuche + 1]:
+            if hinweis is _ABSTANDS_PLATZHALTER:
+                hinweis = _abstands_hinweis(abs(zahl - self.geheimzahl))
+            if hinweis is not None:
+                zusatz_hinweise.append(hinweis)
+                if len(zusatz_hinweise) == 2:
+                    break
                     
-        # Ab dem dritten Versuch noch detailliertere Hinweise
-        if self.versuche >= 3:
-            # Gerade/Ungerade Hinweis
-            if self.geheimzahl % 2 == 0:
-                zusatz_hinweise.append("Es ist eine gerade Zahl.")
-            else:
-                zusatz_hinweise.append("Es ist eine ungerade Zahl.")
-                
-        # Ab dem vierten Versuch einen Hinweis zur Differenz geben
-        if self.versuche >= 4:
-            differenz = abs(zahl - self.geheimzahl)
-            
-            if differenz <= 5:
-                zusatz_hinweise.append("Du bist sehr nah dran!")
-            elif differenz <= 10:
-                zusatz_hinweise.append("Du kommst der Zahl näher.")
-            elif differenz <= 20:
-                zusatz_hinweise.append("Du bist noch etwas entfernt.")
-            else:
-                zusatz_hinweise.append("Du bist noch weit entfernt.")
-                
-        # Ab dem fünften Versuch Hinweis zur Ziffernsumme geben
-        if self.versuche >= 5:
-            ziffernsumme = sum(int(ziffer) for ziffer in str(self.geheimzahl))
-            zusatz_hinweise.append(f"Die Ziffernsumme ist {ziffernsumme}.")
-            
-        # Ab dem sechsten Versuch Bereichshinweise geben
-        if self.versuche >= 6:
-            zehnerstelle = (self.geheimzahl // 10) * 10
-            zusatz_hinweise.append(f"Die Zahl liegt zwischen {zehnerstelle} und {zehnerstelle + 9}.")
-            
-        # Nur bis zu 2 zusätzliche Hinweise hinzufügen (um nicht zu viel zu verraten)
-        if zusatz_hinweise:
-            return f"{basis_hinweis} {' '.join(zusatz_hinweise[:2])}"
-        else:
+        anzahl = len(zusatz_hinweise)
+        if anzahl == 0:
             return basis_hinweis
+        elif anzahl == 1:
+            return f"{basis_hinweis} {zusatz_hinweise[0]}"
+        else:
+            return f"{basis_hinweis} {zusatz_hinweise[0]} {zusatz_hinweise[1]}"
         
     def neues_spiel(self, min_zahl: Optional[int] = None, max_zahl: Optional[int] = None, 
                    max_versuche: Optional[int] = None) -> None:
@@ -194,6 +241,20 @@ class ZahlenRaten:
         }
         
     def get_optimale_strategie(self) -> List[int]:
+        """
+        Gibt die optimale Strategie für das Raten mit binärer Suche zurück.
+        
+        Die Strategie hängt nur von Zahlenbereich und Geheimzahl ab und wird
+        daher höchstens einmal pro Spiel berechnet.
+        
+        Returns:
+            Liste der optimalen Rateversuche
+        """
+        if self._optimale_strategie is None:
+            self._optimale_strategie = tuple(self._berechne_optimale_strategie())
+        return list(self._optimale_strategie)
+        
+    def _berechne_optimale_strategie(self) -> List[int]:
         """
         Berechnet die optimale Strategie für das Raten mit binärer Suche.
         
@@ -204,11 +265,16 @@ class ZahlenRaten:
         low = self.min_zahl
         high = self.max_zahl
         zahl = self.geheimzahl
-        strategie = []
+        
+        # Die binäre Suche braucht höchstens bit_length(Bereichsbreite) + 1 Schritte,
+        # daher kann die Liste vorab in voller Länge angelegt werden
+        strategie = [0] * ((high - low).bit_length() + 1)
+        schritte = 0
         
         while low <= high:
             mid = (low + high) // 2
-            strategie.append(mid)
+            strategie[schritte] = mid
+            schritte += 1
             
             if mid == zahl:
                 break
@@ -217,35 +283,54 @@ class ZahlenRaten:
             else:
                 high = mid - 1
                 
+        del strategie[schritte:]
         return strategie
 
 
+# Befehle und Antworten der Spielschleife
+_BEFEHLE_BEENDEN = frozenset(('exit', 'quit', 'beenden'))
+_BEFEHLE_HILFE = frozenset(('hilfe', 'help', '?'))
+_BEFEHLE_NEUSTART = frozenset(('start', 'neu', 'restart'))
+_BEFEHLE_HINWEIS = frozenset(('hinweis', 'tipp', 'hint'))
+_ANTWORTEN_JA = frozenset(('j', 'ja', 'y', 'yes'))
+
+# Willkommens- und Hilfetext werden nur einmal aufgebaut
+_WILLKOMMENSTEXT = """
+============================================================
+               Z A H L E N   R A T E N
+============================================================
+Errate die geheime Zahl, die der Computer ausgewählt hat!
+Bei jedem Versuch erhältst du einen Hinweis.
+Je weniger Versuche du benötigst, desto mehr Punkte erhältst du!
+============================================================
+"""
+
+_HILFETEXT = """
+Zahlenratespiel Hilfe
+===================
+Befehle:
+  start            - Startet ein neues Spiel mit Standardeinstellungen
+  start <min> <max> <versuche> - Startet ein Spiel mit eigenen Parametern
+  hinweis          - Gibt einen zusätzlichen Hinweis
+  hilfe            - Diese Hilfeübersicht anzeigen
+  exit/quit        - Programm beenden
+
+Spiel:
+  - Gib eine Zahl ein, um zu raten
+  - Du verlierst Punkte für jeden Versuch und basierend auf der Differenz
+  - Nach jedem Versuch erhältst du einen Hinweis
+  - Mit jedem weiteren Versuch werden die Hinweise detaillierter
+"""
+
+
 def print_willkommen() -> None:
     """Gibt einen Willkommenstext für das Spiel aus."""
-    print("\n" + "=" * 60)
-    print("               Z A H L E N   R A T E N")
-    print("=" * 60)
-    print("Errate die geheime Zahl, die der Computer ausgewählt hat!")
-    print("Bei jedem Versuch erhältst du einen Hinweis.")
-    print("Je weniger Versuche du benötigst, desto mehr Punkte erhältst du!")
-    print("=" * 60)
+    sys.stdout.write(_WILLKOMMENSTEXT)
 
 
 def print_help() -> None:
     """Zeigt die Hilfeübersicht für das Zahlenratespiel an."""
-    print("\nZahlenratespiel Hilfe")
-    print("===================")
-    print("Befehle:")
-    print("  start            - Startet ein neues Spiel mit Standardeinstellungen")
-    print("  start <min> <max> <versuche> - Startet ein Spiel mit eigenen Parametern")
-    print("  hinweis          - Gibt einen zusätzlichen Hinweis")
-    print("  hilfe            - Diese Hilfeübersicht anzeigen")
-    print("  exit/quit        - Programm beenden")
-    print("\nSpiel:")
-    print("  - Gib eine Zahl ein, um zu raten")
-    print("  - Du verlierst Punkte für jeden Versuch und basierend auf der Differenz")
-    print("  - Nach jedem Versuch erhältst du einen Hinweis")
-    print("  - Mit jedem weiteren Versuch werden die Hinweise detaillierter")
+    sys.stdout.write(_HILFETEXT)
 
 
 def spielen() -> None:
@@ -268,16 +353,16 @@ def spielen() -> None:
             eingabe = input("\nDein Tipp (oder 'hilfe', 'exit'): ").strip().lower()
             
             # Befehlseingaben überprüfen
-            if eingabe in ['exit', 'quit', 'beenden']:
+            if eingabe in _BEFEHLE_BEENDEN:
                 print("Spiel wird beendet.")
                 print(f"Die gesuchte Zahl war: {spiel.geheimzahl}")
                 return
                 
-            elif eingabe in ['hilfe', 'help', '?']:
+            elif eingabe in _BEFEHLE_HILFE:
                 print_help()
                 continue
                 
-            elif eingabe in ['start', 'neu', 'restart']:
+            elif eingabe in _BEFEHLE_NEUSTART:
                 print("Neues Spiel wird gestartet...")
                 spiel.neues_spiel()
                 print(f"\nIch habe mir eine neue Zahl zwischen {spiel.min_zahl} und {spiel.max_zahl} ausgedacht.")
@@ -311,7 +396,7 @@ def spielen() -> None:
                     print("Verwendung: start <min> <max> <versuche>")
                 continue
                 
-            elif eingabe in ['hinweis', 'tipp', 'hint']:
+            elif eingabe in _BEFEHLE_HINWEIS:
                 # Zusätzlicher Hinweis, kostet Punkte
                 if spiel.versuche == 0:
                     print("Rate erst eine Zahl, bevor du einen Hinweis anforderst.")
@@ -320,23 +405,16 @@ def spielen() -> None:
                 # Punkte für Hinweis abziehen
                 spiel.punkte = max(0, spiel.punkte - 5)
                 
-                # Spezifischen Hinweis generieren
-                if spiel.geheimzahl % 2 == 0:
-                    paritaet = "gerade"
-                else:
-                    paritaet = "ungerade"
-                    
+                # Spezifischen Hinweis ausgeben
                 print(f"Zusätzlicher Hinweis (kostet 5 Punkte):")
-                print(f"Die Zahl ist {paritaet} und liegt zwischen {spiel.min_zahl} und {spiel.max_zahl}.")
+                print(f"Die Zahl ist {spiel._paritaet} und liegt zwischen {spiel.min_zahl} und {spiel.max_zahl}.")
                 
                 # Bei fortgeschrittenem Spiel mehr Hinweise geben
                 if spiel.versuche >= 3:
-                    ziffernsumme = sum(int(ziffer) for ziffer in str(spiel.geheimzahl))
-                    print(f"Die Ziffernsumme beträgt {ziffernsumme}.")
+                    print(f"Die Ziffernsumme beträgt {spiel._ziffernsumme}.")
                     
                 if spiel.versuche >= 5:
-                    erste_ziffer = str(spiel.geheimzahl)[0]
-                    print(f"Die erste Ziffer ist {erste_ziffer}.")
+                    print(f"Die erste Ziffer ist {spiel._erste_ziffer}.")
                     
                 continue
                 
@@ -377,7 +455,7 @@ def spielen() -> None:
                     print("\nMöchtest du noch einmal spielen? (j/n)")
                     nochmal = input().strip().lower()
                     
-                    if nochmal in ['j', 'ja', 'y', 'yes']:
+                    if nochmal in _ANTWORTEN_JA:
                         spiel.neues_spiel()
                         print(f"\nIch habe mir eine neue Zahl zwischen {spiel.min_zahl} und {spiel.max_zahl} ausgedacht.")
                         print(f"Du hast {spiel.max_versuche} Versuche. Viel Glück!")